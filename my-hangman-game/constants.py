@@ -1,18 +1,36 @@
+import functools
+import json
+import os
+import string
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
 import pygame
 
-# Initialize Pygame
-pygame.init()
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional, pygame.image.load is used without it
+    Image = None
 
 # Screen dimensions
 WIDTH, HEIGHT = 1000, 700
 RADIUS = 20
+RADIUS_SQ = RADIUS * RADIUS  # Letter hit tests compare squared distances, which avoids a sqrt per click
 GAP = 15
 
-# Colors
-WHITE = (255, 255, 255)
-BLACK = (0, 0, 0)
-ORANGE_PINK = (255, 153, 153)
-LIGHT_BROWN_ORANGE = (204, 153, 102)
+# Frame rate cap for the game loop
+FPS = 30
+
+# The only events the game handles; every other event type is blocked from the queue.
+# The screens are only redrawn when something changes, so VIDEOEXPOSE is kept to repaint the window after it
+# was covered or minimized.
+GAME_EVENTS = (pygame.QUIT, pygame.MOUSEBUTTONDOWN, pygame.VIDEOEXPOSE)
+
+# Colors, built as pygame.Color once so drawing calls don't convert a tuple each time
+WHITE = pygame.Color(255, 255, 255)
+BLACK = pygame.Color(0, 0, 0)
+ORANGE_PINK = pygame.Color(255, 153, 153)
+LIGHT_BROWN_ORANGE = pygame.Color(204, 153, 102)
 
 # Adjusted coordinates to place the frame image and the hangman image inside it
 FRAME_X = 80
@@ -20,23 +38,285 @@ FRAME_Y = 60
 OFFSET_X = 45
 OFFSET_Y = 45
 
-# Fonts
-LETTER_FONT = pygame.font.SysFont('comicsansms', 35)
-WORD_FONT = pygame.font.SysFont('comicsansms', 45)
-TEXT_FONT = pygame.font.SysFont('comicsansms', 35)
-TITLE_FONT = pygame.font.SysFont('comicsansms', 70)
-BUTTON_FONT = pygame.font.SysFont('comicsansms', 45)
-HINT_FONT = pygame.font.SysFont('comicsansms', 25)
-
-# Load images
-IMAGES = [
-    pygame.image.load("hangman0.png"),
-    pygame.image.load("hangman1.png"),
-    pygame.image.load("hangman2.png"),
-    pygame.image.load("hangman3.png"),
-    pygame.image.load("hangman4.png"),
-    pygame.image.load("hangman5.png"),
-    pygame.image.load("hangman6.png"),
-    pygame.image.load("hangman7.png"),
-]
+# Image files, resolved next to this module rather than against the working directory
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+HANGMAN_PATHS = tuple(os.path.join(BASE_DIR, f"hangman{i}.png") for i in range(8))
+MAX_HANGMAN_STATUS = len(HANGMAN_PATHS) - 1  # The last image, a fully drawn hangman, ends the round
+FRAME_PATH = os.path.join(BASE_DIR, "frame.png")
+# Decoded hangman images from a previous run, so later startups skip the PNG decodes
+IMAGE_CACHE_PATH = os.path.join(BASE_DIR, "hangman.cache")
+
+# The a-z letter buttons, laid out in two rows of 13 on a square grid. The letters and the x and y of
+# each button center are kept in parallel tuples, indexed by letter position.
+LETTER_CHARS = tuple(string.ascii_lowercase)
+LETTERS_PER_ROW = 13
+LETTER_PITCH = RADIUS * 2 + GAP  # Distance between neighbouring button centers, both across and down
+LETTER_START_X = round((WIDTH - LETTER_PITCH * LETTERS_PER_ROW) / 2) + GAP * 2
+LETTER_START_Y = 520
+LETTER_X = tuple(LETTER_START_X + LETTER_PITCH * (i % LETTERS_PER_ROW) for i in range(len(LETTER_CHARS)))
+LETTER_Y = tuple(LETTER_START_Y + LETTER_PITCH * (i // LETTERS_PER_ROW) for i in range(len(LETTER_CHARS)))
+
+
+# Installed font tried when a requested system font is missing, before pygame's default font
+FALLBACK_FONT = 'dejavusans'
+
+
+@functools.lru_cache(maxsize=None)
+def _font_path(name):
+    """
+    Looks up the font file for a system font name once, so creating more sizes skips the font list scan.
+    Falls back to FALLBACK_FONT, then to pygame's default font (None), if the font is not installed.
+    """
+    path = pygame.font.match_font(name)
+    if path is None:
+        path = pygame.font.match_font(FALLBACK_FONT)
+        print(f"Font '{name}' not found, using {path or pygame.font.get_default_font()} instead.")
+    return path
+
+
+@functools.lru_cache(maxsize=None)
+def get_font(name, size):
+    """
+    Returns the system font with the given name and size, creating it on first use.
+    Args:
+        name (str): The system font name, e.g. 'comicsansms'.
+        size (int): The point size of the font.
+    Returns:
+        pygame.font.Font: The cached font object.
+    """
+    return pygame.font.Font(_font_path(name), size)
+
+
+# Rendered text surfaces, keyed by (font id, text, color, antialias), least recently used first.
+# Bounded so that every distinct string drawn (words, hints, scores) can't grow it forever.
+TEXT_CACHE_SIZE = 512
+_TEXT_CACHE = OrderedDict()
+
+
+def render_text(font, text, color, antialias=True):
+    """
+    Renders text with the given font, reusing the surface if the same text was rendered recently.
+    Only use fonts that stay alive for the whole game (e.g. from get_font()), since the cache is keyed by font id.
+    Args:
+        font (pygame.font.Font): The font to render with.
+        text (str): The text to render.
+        color (pygame.Color or tuple): The color of the text.
+        antialias (bool, optional): Whether to antialias the text. Defaults to True.
+    Returns:
+        pygame.Surface: The rendered text surface.
+    """
+    # pygame.Color is not hashable, so key it on its packed RGBA int; tuples are hashable as they are
+    key = (id(font), text, int(color) if isinstance(color, pygame.Color) else color, antialias)
+    surface = _TEXT_CACHE.get(key)
+    if surface is None:
+        surface = font.render(text, antialias, color).convert_alpha()
+        _TEXT_CACHE[key] = surface
+        if len(_TEXT_CACHE) > TEXT_CACHE_SIZE:
+            _TEXT_CACHE.popitem(last=False)
+    else:
+        _TEXT_CACHE.move_to_end(key)
+    return surface
+
+
+def clear_text_cache():
+    """Drops all cached text surfaces, e.g. when moving on to a new round whose strings are all different."""
+    _TEXT_CACHE.clear()
+
+
+# A sprite sheet of the hangman images composited onto the frame image, with one rect per image. Its colors
+# are premultiplied by alpha, so it must be drawn with BLEND_PREMULTIPLIED. Filled in by init_assets().
+HANGMAN_SHEET = None
+HANGMAN_RECTS = ()
+# Each letter's whole button (background and glyph) and the top-left screen position to blit it at.
+# Filled in by init_assets().
+LETTER_BUTTONS = ()
+LETTER_BUTTON_POS = ()
+
+
+def _premultiplied(image):
+    """
+    Returns a copy of an image with its colors premultiplied by its alpha, for blitting with BLEND_PREMULTIPLIED.
+    Args:
+        image (pygame.Surface): The image to premultiply.
+    Returns:
+        pygame.Surface: The premultiplied copy, with per-pixel alpha.
+    """
+    if not image.get_flags() & pygame.SRCALPHA:
+        # premul_alpha() needs per-pixel alpha, so give an opaque image a fully opaque alpha channel first
+        image = pygame.image.frombuffer(pygame.image.tostring(image, 'RGBA'), image.get_size(), 'RGBA')
+    return image.premul_alpha()
+
+
+def _prefetch(paths):
+    """
+    Asks the kernel to start reading the given files into the page cache, so the loads that follow don't wait
+    on the disk. Does nothing on platforms without posix_fadvise, and skips files that can't be opened.
+    Args:
+        paths (iterable): The paths of the files to prefetch.
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+
+
+def _render_letter_button(glyph):
+    """
+    Draws a letter button, the rounded square and its centered glyph, onto one surface.
+    The surface also covers any part of the glyph that sticks out of the square.
+    Args:
+        glyph (pygame.Surface): The rendered letter.
+    Returns:
+        tuple: The button surface and the (x, y) offset of its top-left corner from the button center.
+    """
+    glyph_x = -glyph.get_width() // 2
+    glyph_y = -glyph.get_height() // 2
+    left = min(-RADIUS, glyph_x)
+    top = min(-RADIUS, glyph_y)
+    right = max(RADIUS, glyph_x + glyph.get_width())
+    bottom = max(RADIUS, glyph_y + glyph.get_height())
+    button = pygame.Surface((right - left, bottom - top), pygame.SRCALPHA)
+    pygame.draw.rect(button, ORANGE_PINK, (-RADIUS - left, -RADIUS - top, 2 * RADIUS, 2 * RADIUS),
+                     border_radius=RADIUS // 2)
+    button.blit(glyph, (glyph_x - left, glyph_y - top))
+    return button, (left, top)
+
+
+def _load_image(path):
+    """
+    Loads an image as an RGBA surface.
+    With Pillow installed the PNG is decoded straight into an RGBA buffer and wrapped with
+    pygame.image.frombuffer, skipping SDL_image's format detection; otherwise pygame.image.load is used.
+    Args:
+        path (str): The path of the image file.
+    Returns:
+        pygame.Surface: The loaded image.
+    """
+    if Image is None:
+        return pygame.image.load(path)
+    with Image.open(path) as image:
+        rgba = image.convert('RGBA')
+    return pygame.image.frombuffer(rgba.tobytes(), rgba.size, 'RGBA')
+
+
+def _source_stamps():
+    """Returns the (mtime, size) of each hangman PNG, used to tell whether the image cache is stale."""
+    stamps = []
+    for path in HANGMAN_PATHS:
+        stat = os.stat(path)
+        stamps.append([stat.st_mtime_ns, stat.st_size])
+    return stamps
+
+
+def _read_image_cache():
+    """
+    Reads the decoded hangman images back from the image cache file.
+    The file is a one-line JSON header (source stamps and image sizes) followed by the raw RGBA pixels.
+    Returns:
+        list: The cached images, or None if the cache is missing, unreadable or older than the PNGs.
+    """
+    try:
+        with open(IMAGE_CACHE_PATH, 'rb') as file:
+            data = file.read()
+        header_end = data.index(b'\n')
+        header = json.loads(data[:header_end])
+        if header['sources'] != _source_stamps():
+            return None
+        # Wrap the pixels in place; each surface keeps the one buffer read above alive
+        pixels = memoryview(data)
+        images = []
+        offset = header_end + 1
+        for width, height in header['sizes']:
+            end = offset + width * height * 4
+            images.append(pygame.image.frombuffer(pixels[offset:end], (width, height), 'RGBA'))
+            offset = end
+        return images
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_image_cache(images):
+    """
+    Writes the decoded hangman images to the image cache file. Failing to write it (e.g. a read-only
+    directory) only means the next startup decodes the PNGs again, so it is skipped silently.
+    Args:
+        images (list): The decoded hangman images, in HANGMAN_PATHS order.
+    """
+    header = {'sources': _source_stamps(), 'sizes': [image.get_size() for image in images]}
+    try:
+        with open(IMAGE_CACHE_PATH, 'wb') as file:
+            file.write(json.dumps(header).encode() + b'\n')
+            for image in images:
+                file.write(pygame.image.tostring(image, 'RGBA'))
+    except OSError:
+        pass
+
+
+def init_assets():
+    """
+    Initializes pygame and loads the game assets: the hangman images (from the image cache when it is up to
+    date), each composited onto the frame image in a single sprite sheet, and the a-z letter glyphs and buttons.
+    Loading doesn't need a display; call finalize_assets() after pygame.display.set_mode() to convert the
+    surfaces to the window's pixel format (this is done here already if the display exists).
+    The tuples and HANGMAN_SHEET are rebound, so read them through the module (constants.HANGMAN_SHEET).
+    Calling it again once the assets are loaded does nothing.
+    """
+    global HANGMAN_SHEET, HANGMAN_RECTS, LETTER_BUTTONS, LETTER_BUTTON_POS
+    if HANGMAN_SHEET is not None:
+        return
+    pygame.init()
+    images = _read_image_cache()
+    if images is None:
+        _prefetch(HANGMAN_PATHS + (FRAME_PATH,))
+        # Decode the PNGs concurrently (the decoders release the GIL)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            images = list(executor.map(_load_image, HANGMAN_PATHS))
+        _write_image_cache(images)
+    frame_image = _load_image(FRAME_PATH)
+
+    # Both the frame and the hangman poses are static, so composite them once, stacked in one sprite sheet,
+    # and draw a single area of it per frame. A plain alpha blit onto the transparent sheet would not give the
+    # same pixels as drawing the frame and then the pose on the window wherever the pose overlaps semi-transparent
+    # parts of the frame, so the sheet is built and drawn with premultiplied alpha instead.
+    rects = []
+    top = 0
+    for image in images:
+        width = max(frame_image.get_width(), OFFSET_X + image.get_width())
+        height = max(frame_image.get_height(), OFFSET_Y + image.get_height())
+        rects.append(pygame.Rect(0, top, width, height))
+        top += height
+    HANGMAN_SHEET = pygame.Surface((max(rect.width for rect in rects), top), pygame.SRCALPHA)
+    frame_image = _premultiplied(frame_image)
+    for image, rect in zip(images, rects):
+        HANGMAN_SHEET.blit(frame_image, rect.topleft, special_flags=pygame.BLEND_PREMULTIPLIED)
+        HANGMAN_SHEET.blit(_premultiplied(image), (rect.x + OFFSET_X, rect.y + OFFSET_Y),
+                           special_flags=pygame.BLEND_PREMULTIPLIED)
+    HANGMAN_RECTS = tuple(rects)
+
+    letter_font = get_font('comicsansms', 35)
+    buttons = [_render_letter_button(letter_font.render(ltr, True, WHITE)) for ltr in LETTER_CHARS]
+    LETTER_BUTTONS = tuple(button for button, _ in buttons)
+    LETTER_BUTTON_POS = tuple((x + left, y + top) for x, y, (_, (left, top)) in zip(LETTER_X, LETTER_Y, buttons))
+
+    if pygame.display.get_surface() is not None:
+        finalize_assets()
+
 
+def finalize_assets():
+    """
+    Converts the loaded assets to the pixel format of the current display, so every blit is a straight copy
+    and alpha blend instead of a per-pixel format conversion.
+    Must be called after pygame.display.set_mode() (and again if the display mode changes).
+    """
+    global HANGMAN_SHEET, LETTER_BUTTONS
+    HANGMAN_SHEET = HANGMAN_SHEET.convert_alpha()
+    LETTER_BUTTONS = tuple(button.convert_alpha() for button in LETTER_BUTTONS)
+    # Text rendered so far was converted for the previous display
+    clear_text_cache()
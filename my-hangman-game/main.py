@@ -1,27 +1,76 @@
+import functools
 import pygame
 from player import Player
 from utils import welcome_screen, player_selection, difficulty_theme_selection, show_game_rules, Button
 import random
-import math
 import json
+import constants
 from constants import (
-    IMAGES, WHITE, BLACK, LETTER_FONT, WORD_FONT, WIDTH, HEIGHT,
-    RADIUS, GAP, TEXT_FONT, HINT_FONT, FRAME_X, FRAME_Y,
-    OFFSET_X, OFFSET_Y, ORANGE_PINK, LIGHT_BROWN_ORANGE
+    init_assets, finalize_assets, get_font, render_text, clear_text_cache,
+    LETTER_CHARS, LETTER_X, LETTER_Y, LETTERS_PER_ROW, LETTER_PITCH, LETTER_START_X, LETTER_START_Y,
+    WHITE, BLACK, WIDTH, HEIGHT, FPS, GAME_EVENTS, RADIUS_SQ, FRAME_X, FRAME_Y, LIGHT_BROWN_ORANGE,
+    MAX_HANGMAN_STATUS
 )
 
+# Theme shown for each difficulty level
+_THEMES = {
+    'easy': 'Food Theme',
+    'medium': 'Movie Theme',
+    'hard': 'CS Theme'
+}
 
-def _init_letters():
-    """ Initializes and returns a list of letters for the Hangman game."""
-    letters = []
-    startx = round((WIDTH - (RADIUS * 2 + GAP) * 13) / 2)
-    starty = 520
-    ascii_a = 97
-    for i in range(26):
-        x = startx + GAP * 2 + ((RADIUS * 2 + GAP) * (i % 13))
-        y = starty + ((i // 13) * (GAP + RADIUS * 2))
-        letters.append([x, y, chr(ascii_a + i), True])
-    return letters
+
+@functools.lru_cache(maxsize=None)
+def _load_sound(filename):
+    """
+    Loads a sound effect, once per file.
+    A new HangmanGame is created for every player's turn, so the sounds are kept here rather than
+    being read from disk again each time.
+    Args:
+        filename (str): The path of the sound file.
+    Returns:
+        pygame.mixer.Sound: The loaded sound.
+    """
+    return pygame.mixer.Sound(filename)
+
+
+def _letter_index_at(m_x, m_y):
+    """
+    Finds the letter button under a mouse position.
+    The buttons sit on a regular grid, so the nearest button is found arithmetically and only that one
+    is checked for a hit, instead of testing the distance to all 26.
+    Args:
+        m_x (int): The x-coordinate of the mouse position.
+        m_y (int): The y-coordinate of the mouse position.
+    Returns:
+        int: The index of the letter in LETTER_CHARS, or None if no button is under the position.
+    """
+    col = (m_x - LETTER_START_X + LETTER_PITCH // 2) // LETTER_PITCH
+    row = (m_y - LETTER_START_Y + LETTER_PITCH // 2) // LETTER_PITCH
+    index = row * LETTERS_PER_ROW + col
+    if not (0 <= col < LETTERS_PER_ROW and 0 <= index < len(LETTER_CHARS)):
+        return None
+    if (LETTER_X[index] - m_x) ** 2 + (LETTER_Y[index] - m_y) ** 2 < RADIUS_SQ:
+        return index
+    return None
+
+
+def _letter_mask(letters):
+    """
+    Packs a set of letters into a letter mask: bits 0-25 for a-z, bit i standing for LETTER_CHARS[i], plus
+    bit 26 for any other alphabetic character, which no guess can set, since it can't be guessed either.
+    Args:
+        letters (iterable): The letters to pack; non-alphabetic characters are ignored.
+    Returns:
+        int: The letter mask.
+    """
+    mask = 0
+    for letter in letters:
+        if 'a' <= letter <= 'z':
+            mask |= 1 << (ord(letter) - ord('a'))
+        elif letter.isalpha():
+            mask |= 1 << len(LETTER_CHARS)
+    return mask
 
 
 class HangmanGame:
@@ -33,14 +82,12 @@ class HangmanGame:
         hangman_status (int): The current hangman status, indicating the number of incorrect guesses.
         current_word (str): The word to be guessed by the player.
         guessed_word (str): The word that the player successfully guessed.
-        guessed (set): A set of letters that have been guessed.
-        letters (list): A list of letters to be displayed for guessing.
+        visible (list): Whether each letter button in LETTER_CHARS is still displayed for guessing.
         current_player_index (int): The index of the current player.
         players (list): A list of player objects.
         total_players (int): The total number of players in the game.
         current_round (int): The current round of the game.
         total_rounds (int): The total number of rounds in the game.
-        frame_image (pygame.Surface): The hangman frame image.
         hint_active (bool): Indicates if the hint feature is active.
         hint_message (str): The hint message for the current word.
         difficulty (str): The difficulty level of the game.
@@ -55,6 +102,7 @@ class HangmanGame:
     Methods:
         load_clues(self): Loads clues from a JSON file.
         start(self, difficulty): Starts a new game with the specified difficulty.
+        _choose_word(self): Picks a random word of the current difficulty to be guessed.
         reset_game_state(self): Resets the game state for a new round.
         run(self): The main game loop.
         wait_for_user_input(self): Waits for user input in end round/game states.
@@ -63,6 +111,7 @@ class HangmanGame:
         handle_button_click(self, m_x, m_y): Handles the button click events based on the current game state.
         handle_end_of_game(self): Handles the transition at the end of the game for two-player mode.
         display_status(self): Displays the current game status on the screen.
+        _is_guessed(self, letter): Checks if a letter has been guessed.
         _is_word_guessed(self): Checks if the current word has been completely guessed.
         provide_hint(self): Provides a hint for the current word.
         display_end_round_message(self, message, game_over=False, win=None): Displays a message at the end of a round.
@@ -78,6 +127,7 @@ class HangmanGame:
         _draw_hint_button(self): Draws the hint button on the game window.
         _draw_rounded_rect(self, surface, rect, color, corner_radius): Draws a rounded rectangle on the given surface.
         get_theme_name(self, difficulty): Get the theme name based on the difficulty level.
+        _redraw(self): Redraws the whole game screen and updates the display once.
         _draw(self): Draw the game elements on the game window.
     """
     def load_clues(self):
@@ -87,6 +137,8 @@ class HangmanGame:
         If successful, it loads the clues into the `words_clues` attribute.
         In case of an error (file not found or JSON decode error), it handles
         the exception and sets `words_clues` to an empty dictionary.
+        The words of each difficulty are also stored once here as a tuple, so picking a word doesn't rebuild
+        a list every round; `words_clues` itself stays as is for hint lookups.
         """
         try:
             with open('words_clues.json', 'r') as file:
@@ -97,6 +149,7 @@ class HangmanGame:
         except json.JSONDecodeError:
             print("Error: JSON decoding failed. Check the format of 'words_clues.json'.")
             self.words_clues = {}
+        self._difficulty_words = {difficulty: tuple(clues) for difficulty, clues in self.words_clues.items()}
 
     def __init__(self, window, background, total_player, players, current_player_index):
         print("HangmanGame instance created")  # Keep this to monitor game progression.
@@ -104,29 +157,41 @@ class HangmanGame:
         self.background = background
         self.hangman_status = 0
         self.current_word = ""
+        self._display_word_surface = None  # Rendered word with blanks, None until (re-)rendered by _draw
         self.guessed_word = ""
-        self.guessed = set()
-        self.letters = _init_letters()
+        self._guessed_mask = 0  # The guessed letters as a letter mask, see _letter_mask()
+        self._current_word_mask = 0  # The letters of current_word as a letter mask
+        self.visible = [True] * len(LETTER_CHARS)
         self.current_player_index = current_player_index
         self.players = players
         self.total_players = total_player
         self.current_round = 1
         self.total_rounds = 3
-        self.frame_image = pygame.image.load('frame.png')
         self.load_clues()
         self.hint_active = False
         self.hint_message = ""
         self.difficulty = None
+        self._theme_name = self.get_theme_name(None)
+        self._theme_surface = render_text(get_font('comicsansms', 30), self._theme_name, BLACK)
+        self._status_state = None  # The (player, round, score, hints) the status surfaces were rendered for
+        self._status_surfaces = []
+        self._needs_redraw = True
+        self._message_until = 0  # pygame.time.get_ticks() value at which the current message ends
+        self._clock = pygame.time.Clock()
+        # The hint button never changes, so render its text and size its rect once
+        self._hint_text_surface = render_text(get_font('comicsansms', 20), "Hint", WHITE)
+        self._hint_button_rect = pygame.Rect(10, 10, self._hint_text_surface.get_width() + 20,
+                                             self._hint_text_surface.get_height() + 20)
         self.game_state = "playing"
         self.exit_button = Button(100, 550, 250, 50, 'Exit', (200, 0, 0))
         self.continue_button = Button(550, 550, 400, 50, 'Continue/New Game', (0, 200, 0))
         # Load sound effects with error handling
         try:
-            self.guess_correct_sound = pygame.mixer.Sound('guess_correct.wav')
-            self.guess_wrong_sound = pygame.mixer.Sound('guess_wrong.wav')
-            self.end_round_win_sound = pygame.mixer.Sound('end_of_round_win.wav')
-            self.end_round_lose_sound = pygame.mixer.Sound('end_of_round_lose.wav')
-            self.end_game_sound = pygame.mixer.Sound('end_of_game.wav')
+            self.guess_correct_sound = _load_sound('guess_correct.wav')
+            self.guess_wrong_sound = _load_sound('guess_wrong.wav')
+            self.end_round_win_sound = _load_sound('end_of_round_win.wav')
+            self.end_round_lose_sound = _load_sound('end_of_round_lose.wav')
+            self.end_game_sound = _load_sound('end_of_game.wav')
         except pygame.error as e:
             print(f"Failed to load a sound file: {e}")
             pygame.quit()  # Shut down Pygame modules
@@ -139,30 +204,45 @@ class HangmanGame:
             difficulty (str): The difficulty level for the new game round.
         """
         self.difficulty = difficulty
+        self._theme_name = self.get_theme_name(difficulty)  # Looked up once per game rather than per frame
+        self._theme_surface = render_text(get_font('comicsansms', 30), self._theme_name, BLACK)
         self.hangman_status = 0
-        self.guessed.clear()
-        self.load_clues()
-        words = list(self.words_clues[difficulty].keys())
-        self.current_word = random.choice(words)
-        self.letters = _init_letters()
+        self._guessed_mask = 0
+        self._choose_word()
+        # Hints are looked up in this difficulty's clues only, so hand them to the players once here
+        clues = self.words_clues.get(difficulty, {})
+        for player in self.players:
+            player.set_clues(clues)
+        self.visible = [True] * len(LETTER_CHARS)
         self.hint_active = False
         self.hint_message = ""
+        self._needs_redraw = True
+
+    def _choose_word(self):
+        """
+        Picks a random word of the current difficulty to be guessed.
+        The words are picked straight from the tuple built in load_clues, so no list is built per round.
+        """
+        self.current_word = random.choice(self._difficulty_words[self.difficulty])
+        self._current_word_mask = _letter_mask(self.current_word)
+        self._display_word_surface = None
 
     def reset_game_state(self):
         """
         Resets the game state for a new round.
-        This function clears the set of guessed letters, resets the hangman status,
+        This function clears the guessed letter mask, resets the hangman status,
         deactivates the hint flag, and selects a new word for guessing. It also
-        re-initializes the letters and sets the game state to 'playing'
+        shows all the letter buttons again and sets the game state to 'playing'
         """
-        self.guessed.clear()
+        self._guessed_mask = 0
+        clear_text_cache()
         self.hangman_status = 0
         self.hint_active = False
         self.hint_message = ""
-        words = list(self.words_clues[self.difficulty].keys())
-        self.current_word = random.choice(words)
-        self.letters = _init_letters()
+        self._choose_word()
+        self.visible = [True] * len(LETTER_CHARS)
         self.game_state = "playing"
+        self._needs_redraw = True
         current_player = self.players[self.current_player_index]
         current_player.hints_used = False
 
@@ -175,44 +255,71 @@ class HangmanGame:
          Returns:
                 bool: False if the game is quit, True otherwise.
         """
-        self.window.fill(WHITE)
-        self.window.blit(self.background, (0, 0))
-
         if self.game_state == "playing":
             # Handle events during the game
-            for event in pygame.event.get():
+            for event in pygame.event.get(GAME_EVENTS):
                 if event.type == pygame.QUIT:
                     return False
                 elif event.type == pygame.MOUSEBUTTONDOWN:
-                    mouse_x, mouse_y = pygame.mouse.get_pos()
+                    mouse_x, mouse_y = event.pos
                     self._handle_events(mouse_x, mouse_y)
+                    self._needs_redraw = True
+                elif event.type == pygame.VIDEOEXPOSE:
+                    self._needs_redraw = True  # The window contents were lost
 
             # Check game over conditions
-            if self.guessed:
-                if self.hangman_status >= len(IMAGES) - 1:
+            if self._guessed_mask:
+                if self.hangman_status >= MAX_HANGMAN_STATUS:
                     self.guessed_word = self.current_word
                     self.display_end_round_message("You were hanged!", game_over=True, win=False)
-                    self.update_scores()
-                    self.handle_end_of_round()
 
                 elif self._is_word_guessed():
                     self.guessed_word = self.current_word
-                    self._draw()
+                    # Show the completed word for a second before the message
+                    self._redraw()
+                    self.game_state = "showing_guessed_word"
+                    self._message_until = pygame.time.get_ticks() + 1000
+
+        elif self.game_state in ["showing_guessed_word", "showing_end_message"]:
+            # Keep pumping events while a message is shown, so closing the window still works. Returning False
+            # here would skip the pending scoring and start the next round, so exit as wait_for_user_input does
+            for event in pygame.event.get(GAME_EVENTS):
+                if event.type == pygame.QUIT:
+                    pygame.quit()
+                    quit()
+                elif event.type == pygame.VIDEOEXPOSE:
+                    # The message is still on the display surface, so showing it again is enough
                     pygame.display.update()
-                    pygame.time.delay(1000)
+            if pygame.time.get_ticks() >= self._message_until:
+                if self.game_state == "showing_guessed_word":
                     self.display_end_round_message("Congratulations, you won!", game_over=True, win=True)
+                else:
                     self.update_scores()
                     self.handle_end_of_round()
+                    # Only a new round brings back the board; a game over screen must stay up
+                    if self.game_state == "playing":
+                        self._needs_redraw = True
 
         elif self.game_state in ["end_of_round", "end_of_game_single_player", "end_of_game_two_players_first",
                                  "end_of_game_two_players_second"]:
             # Wait for user input in end round/game states
             self.wait_for_user_input()
+            # A click that missed both buttons leaves the end screen up, so don't paint the board over it
+            if self.game_state == "playing":
+                self._needs_redraw = True
+
+        # Nothing on the game screen changes between clicks, so only redraw and flip when something did
+        if self._needs_redraw:
+            self._redraw()
+        self._clock.tick(FPS)  # Sleep out the rest of the frame instead of spinning
+        return True
 
+    def _redraw(self):
+        """ Redraws the whole game screen and updates the display once."""
+        self.window.blit(self.background, (0, 0))
         self._draw()
-
         pygame.display.update()
-        return True
+        self._needs_redraw = False
 
     def wait_for_user_input(self):
         """
@@ -221,21 +328,27 @@ class HangmanGame:
         a button. It handles the click events for the exit and continue/new game
         buttons.
         """
+        # Draw the exit and continue buttons once, they don't change while waiting
+        self.exit_button.draw(self.window)
+        self.continue_button.draw(self.window)
+        pygame.display.update()
+
+        # Block until the next event instead of polling
         waiting_for_user_input = True
         while waiting_for_user_input:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    quit()
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    mouse_x, mouse_y = pygame.mouse.get_pos()
-                    self.handle_button_click(mouse_x, mouse_y)
-                    waiting_for_user_input = False  # Stop waiting after a click
-
-            # Redraw the exit and continue buttons
-            self.exit_button.draw(self.window)
-            self.continue_button.draw(self.window)
-            pygame.display.update()
+            event = pygame.event.wait()
+            if event.type == pygame.VIDEOEXPOSE:
+                # Repaint the buttons over the message still on the display surface and show it again
+                self.exit_button.draw(self.window)
+                self.continue_button.draw(self.window)
+                pygame.display.update()
+            elif event.type == pygame.QUIT:
+                pygame.quit()
+                quit()
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                mouse_x, mouse_y = event.pos
+                self.handle_button_click(mouse_x, mouse_y)
+                waiting_for_user_input = False  # Stop waiting after a click
 
     def _handle_events(self, m_x, m_y):
         """
@@ -248,35 +361,33 @@ class HangmanGame:
         Returns:
             bool: True if an event was handled, False otherwise.
         """
-        # Handle letter clicks
-        for letter in self.letters:
-            x, y, ltr, visible = letter
-            if visible and math.sqrt((x - m_x) ** 2 + (y - m_y) ** 2) < RADIUS:
-                letter[3] = False  # Mark the letter as not visible
-                guessed_letter = ltr.lower()
-                if guessed_letter not in self.guessed:
-                    self.guessed.add(guessed_letter)
-                    if guessed_letter in self.current_word:
-                        self.guess_correct_sound.play()  # Play correct guess sound
-                    else:
-                        self.guess_wrong_sound.play()  # Play wrong guess sound
-                        if self.hangman_status < len(IMAGES) - 1:
-                            self.hangman_status += 1
-                return True
-
-        # Handle hint button click
-        hint_button_rect = self._draw_hint_button()
-        if hint_button_rect.collidepoint((m_x, m_y)):
+        # Handle hint button click, a cheap rect test done before looking up a letter
+        if self._hint_button_rect.collidepoint((m_x, m_y)):
             self.hint_message = self.provide_hint()
             self.hint_active = True
+            return True
+
+        # Handle letter clicks
+        index = _letter_index_at(m_x, m_y)
+        if index is not None and self.visible[index]:
+            self.visible[index] = False  # Mark the letter as not visible
+            letter_bit = 1 << index
+            if not self._guessed_mask & letter_bit:
+                self._guessed_mask |= letter_bit
+                self._display_word_surface = None
+                if self._current_word_mask & letter_bit:
+                    self.guess_correct_sound.play()  # Play correct guess sound
+                else:
+                    self.guess_wrong_sound.play()  # Play wrong guess sound
+                    if self.hangman_status < MAX_HANGMAN_STATUS:
+                        self.hangman_status += 1
 
-        self._draw()
         return True
 
     def update_scores(self):
         """Update scores based on game conditions."""
         current_player = self.players[self.current_player_index]
-        if self._is_word_guessed() and self.hangman_status < len(IMAGES) - 1:
+        if self._is_word_guessed() and self.hangman_status < MAX_HANGMAN_STATUS:
             # Add basic points based on remaining lives
             points_to_add = 7 - self.hangman_status
             current_player.update_score(points_to_add)
@@ -364,21 +475,34 @@ class HangmanGame:
         x = WIDTH - 150  # Adjust as needed
         y = 20
 
-        current_player_hints = self.players[self.current_player_index].hints_left
-        # Create and display each line of the status
-        status_font = pygame.font.SysFont('comicsansms', 20)
-        lines = [
-            f"Player: {self.current_player_index + 1}/{self.total_players}",
-            f"Round: {self.current_round}/{self.total_rounds}",
-            f"Scores: {self.players[self.current_player_index].score}",
-            f"Hints left: {current_player_hints}",
-        ]
-
-        for line in lines:
-            text = status_font.render(line, 1, BLACK)
+        current_player = self.players[self.current_player_index]
+        state = (self.current_player_index, self.current_round, current_player.score, current_player.hints_left)
+        # Only re-render the status lines when one of the values changes
+        if state != self._status_state:
+            status_font = get_font('comicsansms', 20)
+            lines = [
+                f"Player: {self.current_player_index + 1}/{self.total_players}",
+                f"Round: {self.current_round}/{self.total_rounds}",
+                f"Scores: {current_player.score}",
+                f"Hints left: {current_player.hints_left}",
+            ]
+            self._status_surfaces = [status_font.render(line, 1, BLACK) for line in lines]
+            self._status_state = state
+
+        for text in self._status_surfaces:
             self.window.blit(text, (x, y))
             y += 25  # Increment y to display the next line lower
 
+    def _is_guessed(self, letter):
+        """
+        Checks if a letter has been guessed, with a bit test on the guessed letter mask.
+        Args:
+            letter (str): The letter to check.
+        Returns:
+            bool: True if the letter has been guessed, False otherwise.
+        """
+        return 'a' <= letter <= 'z' and self._guessed_mask >> (ord(letter) - ord('a')) & 1 == 1
+
     def _is_word_guessed(self):
         """
         Checks if the current word has been completely guessed.
@@ -388,30 +512,32 @@ class HangmanGame:
         """
         if not self.current_word.strip():
             return False
-        return all(letter in self.guessed for letter in self.current_word if letter.isalpha())
+        # Guessed when no letter of the word is missing from the guesses
+        return (self._current_word_mask & ~self._guessed_mask) == 0
 
     def provide_hint(self):
         """
         Provides a hint for the current word.
         This function retrieves a hint from the current player's available hints,
-            based on the game's difficulty and the current word.
+            based on the current word and the clues set for the game's difficulty in start().
         Returns:
             str: The hint for the current word, or a message if no hints are left.
         """
         current_player = self.players[self.current_player_index]
-        return current_player.provide_hint(self.words_clues, self.difficulty, self.current_word)
+        return current_player.provide_hint(self.current_word)
 
     def display_end_round_message(self, message, game_over=False, win=None):
         """
         Displays a message at the end of a round. It also shows the final word and plays sounds based on win/lose.
+        Rather than blocking for the 3 seconds the message stays up, this switches the game to the
+        'showing_end_message' state, and run() moves on to the end of the round once the time is up.
         Args:
             message (str): The message to display.
             game_over (bool, optional): Indicates if the game is over. Defaults to False.
             win (bool, optional): Indicates if the player won the round. Defaults to None.
         """
-        self.window.fill(WHITE)
         self.window.blit(self.background, (0, 0))
-        text = TEXT_FONT.render(message, 1, BLACK)
+        text = render_text(get_font('comicsansms', 35), message, BLACK)
         self.window.blit(text, (WIDTH / 2 - text.get_width() / 2, HEIGHT / 2 - text.get_height() / 2))
         if game_over:
             if win:
@@ -420,7 +546,7 @@ class HangmanGame:
             else:
                 extra_message = f"The word was {self.guessed_word}."
                 self.end_round_lose_sound.play()  # Play lose sound
-            extra_text = TEXT_FONT.render(extra_message, 1, BLACK)
+            extra_text = render_text(get_font('comicsansms', 35), extra_message, BLACK)
             self.window.blit(extra_text, (WIDTH / 2 - extra_text.get_width() / 2, HEIGHT / 2 + 50))
 
             # Display remaining games
@@ -429,19 +555,19 @@ class HangmanGame:
                 games_left_message = "No more rounds left."
             else:
                 games_left_message = f"You have {games_left} more round(s) left."
-            games_left_text = WORD_FONT.render(games_left_message, 1, BLACK)
+            games_left_text = render_text(get_font('comicsansms', 45), games_left_message, BLACK)
             self.window.blit(games_left_text, (WIDTH / 2 - games_left_text.get_width() / 2, HEIGHT / 2 + 150))
 
         pygame.display.update()
-        pygame.time.delay(3000)
+        self.game_state = "showing_end_message"
+        self._message_until = pygame.time.get_ticks() + 3000
+        self._needs_redraw = False  # The click that ended the round must not redraw the board over the message
 
     def display_game_over_single_player(self):
         """ Displays a message when game over in single player game"""
         final_score = self.players[0].score
         self.end_game_sound.play()
         message = f"Game Over! Your final score: {final_score}."
-        self.window.fill(WHITE)
-        self.window.blit(self.background, (0, 0))
         self._display_end_game_button(message)
         # Wait for user input before proceeding
         self.wait_for_user_input()
@@ -472,9 +598,8 @@ class HangmanGame:
 
     def _display_end_first_player_button(self, message):
         """ Displays the exit and continue button at the end of first player in a 2 player game"""
-        self.window.fill(WHITE)
         self.window.blit(self.background, (0, 0))
-        text = TEXT_FONT.render(message, 1, BLACK)
+        text = render_text(get_font('comicsansms', 35), message, BLACK)
         self.window.blit(text, (WIDTH / 2 - text.get_width() / 2, HEIGHT / 2 - text.get_height() / 2))
 
         self.exit_button.draw(self.window)
@@ -483,7 +608,6 @@ class HangmanGame:
 
     def _display_end_game_button(self, message):
         """ Displays the exit and continue button and message at the end of second player in a 2 player game"""
-        self.window.fill(WHITE)
         self.window.blit(self.background, (0, 0))
 
         # Split the message into lines
@@ -491,7 +615,7 @@ class HangmanGame:
         y_offset = 0  # Starting y offset for the first line
 
         for line in lines:
-            text_surface = WORD_FONT.render(line, 1, BLACK)
+            text_surface = render_text(get_font('comicsansms', 45), line, BLACK)
             text_x = WIDTH / 2 - text_surface.get_width() / 2
             text_y = HEIGHT / 2 - text_surface.get_height() / 2 + y_offset
             self.window.blit(text_surface, (text_x, text_y))
@@ -504,12 +628,9 @@ class HangmanGame:
     def _draw_hint_button(self):
         """ Draws the hint button on the game window."""
         hint_button_color = (255, 153, 102)  # Warm light orange color
-        font = pygame.font.SysFont('comicsansms', 20)
-        hint_text = font.render("Hint", True, WHITE)
-        hint_button_rect = pygame.Rect(10, 10, hint_text.get_width() + 20, hint_text.get_height() + 20)
-        pygame.draw.rect(self.window, hint_button_color, hint_button_rect)
-        self.window.blit(hint_text, (hint_button_rect.x + 10, hint_button_rect.y + 10))
-        return hint_button_rect
+        pygame.draw.rect(self.window, hint_button_color, self._hint_button_rect)
+        self.window.blit(self._hint_text_surface, (self._hint_button_rect.x + 10, self._hint_button_rect.y + 10))
+        return self._hint_button_rect
 
     def _draw_rounded_rect(self, surface, rect, color, corner_radius):
         """
@@ -548,12 +669,7 @@ class HangmanGame:
             str: The theme name corresponding to the difficulty level. Returns 'Unknown Theme' if the
             difficulty level is not recognized.
         """
-        themes = {
-            'easy': 'Food Theme',
-            'medium': 'Movie Theme',
-            'hard': 'CS Theme'
-        }
-        return themes.get(difficulty, 'Unknown Theme')
+        return _THEMES.get(difficulty, 'Unknown Theme')
 
     def _draw(self):
         """
@@ -561,49 +677,35 @@ class HangmanGame:
         This function draws various game elements on the game window, including the displayed word,
         theme information, letter buttons, hangman frame, player status, and hint button.
         """
-        display_word = ""
-        for letter in self.current_word:
-            if letter in self.guessed:
-                display_word += letter + " "
-            else:
-                display_word += "_ "
-        text = WORD_FONT.render(display_word, 1, LIGHT_BROWN_ORANGE)
-        self.window.blit(text, (480, 380))
-
-        # Display the theme
-        theme_text = self.get_theme_name(self.difficulty)
-        theme_font = pygame.font.SysFont('comicsansms', 30)  # Choose an appropriate font size
-        theme_surface = theme_font.render(theme_text, True, (0, 0, 0))  # Render the text
+        # The word only changes when a letter is guessed or a new word is picked
+        if self._display_word_surface is None:
+            display_word = "".join((letter if self._is_guessed(letter) else "_") + " " for letter in self.current_word)
+            self._display_word_surface = render_text(get_font('comicsansms', 45), display_word, LIGHT_BROWN_ORANGE)
+        self.window.blit(self._display_word_surface, (480, 380))
 
+        # Display the theme, rendered when the difficulty is set
         # Calculate the position (upper mid-right of the screen)
-        theme_x = WIDTH - theme_surface.get_width() - 320  # Adjust the position as needed
+        theme_x = WIDTH - self._theme_surface.get_width() - 320  # Adjust the position as needed
         theme_y = 90
 
-        self.window.blit(theme_surface, (theme_x, theme_y))
+        self.window.blit(self._theme_surface, (theme_x, theme_y))
 
-        for letter in self.letters:
-            x, y, ltr, visible = letter
-            if visible:
-                # Draw a square button with soft edges
-                button_rect = pygame.Rect(x - RADIUS, y - RADIUS, 2 * RADIUS, 2 * RADIUS)
-                pygame.draw.rect(self.window, ORANGE_PINK, button_rect, border_radius=RADIUS // 2)
+        # Blit the visible letters' pre-rendered buttons (soft-edged square with the white letter) in one batch
+        self.window.blits([(constants.LETTER_BUTTONS[i], constants.LETTER_BUTTON_POS[i])
+                           for i, visible in enumerate(self.visible) if visible], doreturn=False)
 
-                # Render the letter in white
-                text = LETTER_FONT.render(ltr, True, WHITE)
-                self.window.blit(text, (x - text.get_width() / 2, y - text.get_height() / 2))
-
-        self.window.blit(self.frame_image, (FRAME_X, FRAME_Y))
-        self.window.blit(IMAGES[self.hangman_status], (FRAME_X + OFFSET_X, FRAME_Y + OFFSET_Y))
+        # The sheet holds premultiplied colors, see constants.init_assets()
+        self.window.blit(constants.HANGMAN_SHEET, (FRAME_X, FRAME_Y), constants.HANGMAN_RECTS[self.hangman_status],
+                         special_flags=pygame.BLEND_PREMULTIPLIED)
 
         self.display_status()
 
         hint_button_rect = self._draw_hint_button()
         if self.hint_active:
-            hint_text = HINT_FONT.render(self.hint_message, True, BLACK)
+            # render_text hands back the cached surface, the hint changes at most once a round
+            hint_text = render_text(get_font('comicsansms', 25), self.hint_message, BLACK)
             self.window.blit(hint_text, (hint_button_rect.x + hint_button_rect.width + 10, hint_button_rect.y + 10))
 
-        pygame.display.update()
-
 
 def main():
     """
@@ -613,6 +715,7 @@ def main():
     """
     pygame.init()
     pygame.mixer.init()  # Initialize the mixer module
+    init_assets()  # Load images and glyphs; they are converted to the window's format once it exists
     # exception handling for loading sound files
     try:
         pygame.mixer.music.load('background_music_2.mp3')
@@ -626,11 +729,15 @@ def main():
 
     win = pygame.display.set_mode((WIDTH, HEIGHT))
     pygame.display.set_caption("Shuting's Hangman Game")
+    finalize_assets()
+    # Keep mouse motion and other unhandled events out of the queue, SDL drops them before Python sees them
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(GAME_EVENTS)
 
     # exception handling for loading background
     try:
         background = pygame.image.load("background.png")
-        background = pygame.transform.scale(background, (WIDTH, HEIGHT))
+        background = pygame.transform.scale(background, (WIDTH, HEIGHT)).convert()  # Opaque, in the window's format
     except pygame.error as e:
         print(f"Failed to load background image: {e}")
         pygame.quit()  # Shut down Pygame modules
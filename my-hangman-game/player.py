@@ -3,29 +3,53 @@ class Player:
     This class represents a player in the game with attributes to track their progress and performance.
     Attributes:
         name (str): The name of the player.
-        guessed_letters (set): A set of letters that the player has guessed so far.
+        guessed_letters_mask (int): The letters that the player has guessed so far, as a mask with bit 0 for 'a'
+            up to bit 25 for 'z'.
         score (int): The current score of the player.
         hints_used (bool): A flag indicating whether the player has used a hint.
         hints_left (int): The number of hints left for the player.
+        current_clues (dict): The clues of the words in the current game's difficulty level, keyed by word.
     """
     def __init__(self, name):
         self.name = name
-        self.guessed_letters = set()
+        self.guessed_letters_mask = 0
         self.score = 0
         self.hints_used = False
         self.hints_left = 3  # Each player starts with 3 hints
+        self.current_clues = {}
 
     def make_guess(self, letter):
         """
-        Adds a guessed letter to the set of guessed letters.
+        Adds a guessed letter to the guessed letter mask.
+        Anything other than a-z (e.g. the space in a movie title) has no bit in the mask and is ignored.
         Args:
             letter (str): The letter that the player guesses.
         """
-        self.guessed_letters.add(letter)
+        letter = letter.lower()
+        if len(letter) == 1 and 'a' <= letter <= 'z':
+            self.guessed_letters_mask |= 1 << (ord(letter) - ord('a'))
+
+    def has_guessed(self, letter):
+        """
+        Checks if the player has guessed a letter, with a bit test on the guessed letter mask.
+        Args:
+            letter (str): The letter to check.
+        Returns:
+            bool: True if the letter has been guessed, False otherwise (always for anything other than a-z).
+        """
+        letter = letter.lower()
+        if len(letter) != 1 or not 'a' <= letter <= 'z':
+            return False
+        return self.guessed_letters_mask >> (ord(letter) - ord('a')) & 1 == 1
+
+    @property
+    def guessed_letters(self):
+        """set: The letters that the player has guessed so far, unpacked from the guessed letter mask."""
+        return {chr(ord('a') + i) for i in range(26) if self.guessed_letters_mask >> i & 1}
 
     def reset(self):
         """Reset the player's guessed letters and score for a new game."""
-        self.guessed_letters.clear()
+        self.guessed_letters_mask = 0
         self.score = 0
 
     def update_score(self, points):
@@ -36,12 +60,18 @@ class Player:
         """
         self.score += points
 
-    def provide_hint(self, words_clues, difficulty, current_word):
+    def set_clues(self, clues_for_difficulty):
+        """
+        Sets the clues that hints are taken from, once per game since the difficulty doesn't change during it.
+        Args:
+            clues_for_difficulty (dict): A dictionary of the words of the game's difficulty level and their clues.
+        """
+        self.current_clues = clues_for_difficulty
+
+    def provide_hint(self, current_word):
         """
         Provides a hint for the current word if hints are available.
         Args:
-            words_clues (dict): A dictionary of words and their associated clues.
-            difficulty (str): The difficulty level of the game.
             current_word (str): The current word that the player needs to guess.
         Returns:
             str: The hint for the current word or a message indicating no hints are left.
@@ -49,7 +79,7 @@ class Player:
         if self.hints_left > 0:
             self.hints_left -= 1  # Decrement hints_left when providing a hint
             self.hints_used = True
-            hint = words_clues.get(difficulty, {}).get(current_word, "No clue available")
+            hint = self.current_clues.get(current_word, "No clue available")
             return hint
         else:
             return "No hints left."
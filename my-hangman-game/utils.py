@@ -1,5 +1,6 @@
+import functools
 import pygame
-from constants import WIDTH, HEIGHT
+from constants import WIDTH, HEIGHT, BLACK, get_font, render_text
 
 
 class Button:
@@ -23,6 +24,15 @@ class Button:
         self.text = text
         self.color = color
         self.border_radius = border_radius
+        # Built once so drawing and hit testing don't turn tuples into rects on every call
+        self._rect = pygame.Rect(x, y, width, height)
+        self._outline_rect = pygame.Rect(x - 2, y - 2, width + 4, height + 4)
+        # The label never changes, so render it and work out where it goes once
+        self._text_surface = None
+        if self.text != '':
+            self._text_surface = render_text(get_font('comicsansms', 40), self.text, BLACK)
+            self._text_pos = (self.x + (self.width / 2 - self._text_surface.get_width() / 2),
+                              self.y + (self.height / 2 - self._text_surface.get_height() / 2))
 
     def draw(self, win, outline=None):
         """
@@ -33,16 +43,12 @@ class Button:
         """
         if outline:
             # Pygame doesn't support border_radius in drawing outlines, so we have to draw an outline rect first
-            pygame.draw.rect(win, outline, (self.x - 2, self.y - 2, self.width + 4, self.height + 4),
-                             border_radius=self.border_radius)
+            pygame.draw.rect(win, outline, self._outline_rect, border_radius=self.border_radius)
 
-        pygame.draw.rect(win, self.color, (self.x, self.y, self.width, self.height), border_radius=self.border_radius)
+        pygame.draw.rect(win, self.color, self._rect, border_radius=self.border_radius)
 
-        if self.text != '':
-            font = pygame.font.SysFont('comicsansms', 40)
-            text = font.render(self.text, True, (0, 0, 0))  # True to enable antialiasing
-            win.blit(text, (
-                self.x + (self.width / 2 - text.get_width() / 2), self.y + (self.height / 2 - text.get_height() / 2)))
+        if self._text_surface is not None:
+            win.blit(self._text_surface, self._text_pos)
 
     def is_over(self, pos):
         """
@@ -52,7 +58,47 @@ class Button:
         Returns:
             bool: True if the position is over the button, False otherwise.
         """
-        return self.x < pos[0] < self.x + self.width and self.y < pos[1] < self.y + self.height
+        return self._rect.collidepoint(pos)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_menu_image(filename):
+    """
+    Loads an image for the menu screens, once per file.
+    The image is converted to the window's pixel format (keeping its transparency), so blitting it
+    doesn't convert every pixel again.
+    Args:
+        filename (str): The path of the image file.
+    Returns:
+        pygame.Surface: The loaded image.
+    """
+    return pygame.image.load(filename).convert_alpha()
+
+
+def _wait_for_click(win, draw):
+    """
+    Shows a menu screen until the player clicks somewhere on it.
+    The menu screens never change, so the screen is only drawn the first time and again when the window
+    contents were lost, blocking until the next event in between instead of polling.
+    Args:
+        win (pygame.Surface): The pygame window or surface to draw the screen on.
+        draw (callable): Draws the screen onto the window it is passed.
+    Returns:
+        tuple: The position of the click, or None if the window was closed.
+    """
+    dirty = True
+    while True:
+        if dirty:
+            draw(win)
+            pygame.display.update()
+            dirty = False
+        event = pygame.event.wait()
+        if event.type == pygame.VIDEOEXPOSE:
+            dirty = True
+        elif event.type == pygame.QUIT:
+            return None
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            return event.pos
 
 
 def welcome_screen(win, background, click_sound):
@@ -63,9 +109,9 @@ def welcome_screen(win, background, click_sound):
         background (pygame.Surface): The background image for the welcome screen.
         click_sound (pygame.mixer.Sound): The sound to play when a button is clicked.
     """
-    logo_image = pygame.image.load("logo.png")
-    title_image = pygame.image.load("title.png")
-    enter_game_image = pygame.image.load("enter.png")
+    logo_image = _load_menu_image("logo.png")
+    title_image = _load_menu_image("title.png")
+    enter_game_image = _load_menu_image("enter.png")
     enter_game_rect = enter_game_image.get_rect(center=(WIDTH // 2, HEIGHT // 2 + 180))  # Adjust position as needed
 
     # Position for the logo image
@@ -74,8 +120,7 @@ def welcome_screen(win, background, click_sound):
     # Position for the title image
     title_pos = ((WIDTH - title_image.get_width()) // 2, HEIGHT // 2 - title_image.get_height() // 2)
 
-    run = True
-    while run:
+    def draw(win):
         # Blit background
         win.blit(background, (0, 0))
 
@@ -88,18 +133,15 @@ def welcome_screen(win, background, click_sound):
         # Blit "Enter Game" text image
         win.blit(enter_game_image, enter_game_rect)
 
-        # Update display
-        pygame.display.update()
-
-        # Mouse Event handling
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                quit()
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if enter_game_rect.collidepoint(pygame.mouse.get_pos()):
-                    click_sound.play()
-                    run = False  # Exit the welcome screen and proceed to the game
+    # Mouse Event handling
+    while True:
+        pos = _wait_for_click(win, draw)
+        if pos is None:
+            pygame.quit()
+            quit()
+        if enter_game_rect.collidepoint(pos):
+            click_sound.play()
+            return  # Exit the welcome screen and proceed to the game
 
 
 def show_game_rules(window, background, click_sound):
@@ -110,33 +152,34 @@ def show_game_rules(window, background, click_sound):
         background (pygame.Surface): The background image for the rules screen.
         click_sound (pygame.mixer.Sound): The sound to play when a button is clicked.
     """
-    running = True
     # Create buttons
     start_button = Button(250, 600, 120, 50, 'Start', (0, 200, 0))  # Adjust position and size as needed
     exit_button = Button(550, 600, 120, 50, 'Exit', (200, 0, 0))
 
-    while running:
+    font = get_font('comicsansms', 20)
+    rules = [
+        "How to Play: ",
+        " - Play Alone or With a Friend: Choose to play by yourself or with someone else.",
+        " - Themes & Difficulty: Pick from 3 themes, each at a different level of difficulty.",
+        " - Three Rounds to Play: Each game has THREE rounds.",
+        " - In Each Round: You have 7 tries to guess the word.",
+        " - Lose a Life for Wrong Guess: Each wrong guess costs you one try.",
+        " - Right Guess: Correct guesses reveal letters.",
+        " - Out of Tries? You are hanged.",
+        " - Win Points: Correctly guess the word to win points based on remaining tries.",
+        " - Bonus Points: You get ONE HINT per round, but you will get 10 BONUS POINTS ",
+        " if you guess correctly without hint.",
+        " - Highest Score Wins: The more points you score, the better!",
+        "Have fun and good luck guessing the words!"
+    ]
+    # The rules never change, so render them once rather than every frame
+    rendered_rules = [render_text(font, line, BLACK) for line in rules]
+
+    def draw(window):
         window.blit(background, (0, 0))
-        font = pygame.font.SysFont('comicsansms', 20)
-        rules = [
-            "How to Play: ",
-            " - Play Alone or With a Friend: Choose to play by yourself or with someone else.",
-            " - Themes & Difficulty: Pick from 3 themes, each at a different level of difficulty.",
-            " - Three Rounds to Play: Each game has THREE rounds.",
-            " - In Each Round: You have 7 tries to guess the word.",
-            " - Lose a Life for Wrong Guess: Each wrong guess costs you one try.",
-            " - Right Guess: Correct guesses reveal letters.",
-            " - Out of Tries? You are hanged.",
-            " - Win Points: Correctly guess the word to win points based on remaining tries.",
-            " - Bonus Points: You get ONE HINT per round, but you will get 10 BONUS POINTS ",
-            " if you guess correctly without hint.",
-            " - Highest Score Wins: The more points you score, the better!",
-            "Have fun and good luck guessing the words!"
-        ]
 
         y = 50  # Starting Y position of the first line
-        for line in rules:
-            text = font.render(line, True, (0, 0, 0))
+        for text in rendered_rules:
             window.blit(text, (50, y))
             y += 40  # Increment Y position for next line
 
@@ -144,19 +187,17 @@ def show_game_rules(window, background, click_sound):
         start_button.draw(window)
         exit_button.draw(window)
 
-        # Mouse Event handling
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            elif event.type == pygame.MOUSEBUTTONDOWN:
-                if start_button.is_over(pygame.mouse.get_pos()):
-                    click_sound.play()
-                    return "start"  # Proceed to start the game
-                elif exit_button.is_over(pygame.mouse.get_pos()):
-                    click_sound.play()
-                    return "exit"  # Exit the game
-
-        pygame.display.update()
+    # Mouse Event handling
+    while True:
+        pos = _wait_for_click(window, draw)
+        if pos is None:
+            return None
+        if start_button.is_over(pos):
+            click_sound.play()
+            return "start"  # Proceed to start the game
+        elif exit_button.is_over(pos):
+            click_sound.play()
+            return "exit"  # Exit the game
 
 
 def player_selection(win, background, click_sound):
@@ -170,29 +211,28 @@ def player_selection(win, background, click_sound):
         int: The number of players selected.
     """
     button_color = (204, 153, 102)  # Grey color for button
-    title_font = pygame.font.SysFont('comicsansms', 50)
+    title_font = get_font('comicsansms', 50)
     title_text = title_font.render('Choose the number of players', True, (0, 0, 0))  # Black color for the title
 
     one_player_button = Button(WIDTH / 2 - 280, HEIGHT / 2 - 100, 500, 70, '1 Player', button_color)
     two_player_button = Button(WIDTH / 2 - 280, HEIGHT / 2, 500, 70, '2 Players', button_color)
-    run = True
-    while run:
+
+    def draw(win):
         win.blit(background, (0, 0))
         win.blit(title_text, (WIDTH / 2 - title_text.get_width() / 2, HEIGHT / 2 - 200))
         one_player_button.draw(win)
         two_player_button.draw(win)
-        pygame.display.update()
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                quit()
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                pos = pygame.mouse.get_pos()
-                click_sound.play()
-                if one_player_button.is_over(pos):
-                    return 1
-                elif two_player_button.is_over(pos):
-                    return 2
+
+    while True:
+        pos = _wait_for_click(win, draw)
+        if pos is None:
+            pygame.quit()
+            quit()
+        click_sound.play()
+        if one_player_button.is_over(pos):
+            return 1
+        elif two_player_button.is_over(pos):
+            return 2
 
 
 def difficulty_theme_selection(win, background, click_sound):
@@ -206,32 +246,29 @@ def difficulty_theme_selection(win, background, click_sound):
         str: The selected difficulty level.
     """
     button_color = (204, 153, 102)  # Grey color for button
-    title_font = pygame.font.SysFont('comicsansms', 50)
+    title_font = get_font('comicsansms', 50)
     title_text = title_font.render('Choose difficulty level', True, (0, 0, 0))
 
     easy_button = Button(WIDTH / 2 - 250, HEIGHT / 2 - 100, 500, 70, 'Easy - food theme', button_color)
     medium_button = Button(WIDTH / 2 - 250, HEIGHT / 2, 500, 70, 'Medium - movie theme', button_color)
     hard_button = Button(WIDTH / 2 - 250, HEIGHT / 2 + 100, 500, 70, 'Hard - CS theme', button_color)
-    run = True
-    while run:
+
+    def draw(win):
         win.blit(background, (0, 0))
         win.blit(title_text, (WIDTH / 2 - title_text.get_width() / 2, HEIGHT / 2 - 200))
         easy_button.draw(win)
         medium_button.draw(win)
         hard_button.draw(win)
-        pygame.display.update()
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                quit()
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                pos = pygame.mouse.get_pos()
-                click_sound.play()
-                if easy_button.is_over(pos):
-                    return 'easy'
-                elif medium_button.is_over(pos):
-                    return 'medium'
-                elif hard_button.is_over(pos):
-                    return 'hard'
-    return 'easy'
 
+    while True:
+        pos = _wait_for_click(win, draw)
+        if pos is None:
+            pygame.quit()
+            quit()
+        click_sound.play()
+        if easy_button.is_over(pos):
+            return 'easy'
+        elif medium_button.is_over(pos):
+            return 'medium'
+        elif hard_button.is_over(pos):
+            return 'hard'